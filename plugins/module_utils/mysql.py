@@ -14,6 +14,7 @@ from functools import reduce
 __metaclass__ = type
 
 import os
+import weakref
 
 from ansible.module_utils.six.moves import configparser
 from ansible.module_utils._text import to_native
@@ -185,6 +186,17 @@ def mysql_connect(module, login_user=None, login_password=None, config_file='',
         return db_connection.cursor(), db_connection
 
 
+def is_server_unreachable(error):
+    """Check if a connection error means the server could not be reached at all.
+
+    CR_CONNECTION_ERROR (2002), CR_CONN_HOST_ERROR (2003) and
+    CR_UNKNOWN_HOST (2005) are raised before authentication happens,
+    so retrying with other credentials cannot succeed.
+    """
+    args = getattr(error, 'args', ())
+    return bool(args) and args[0] in (2002, 2003, 2005)
+
+
 def mysql_common_argument_spec():
     return dict(
         login_user=dict(type='str', default=None),
@@ -201,8 +213,18 @@ def mysql_common_argument_spec():
     )
 
 
+# The server version cannot change during a session,
+# so it is queried only once per cursor
+_server_versions = weakref.WeakKeyDictionary()
+
+
 def get_server_version(cursor):
     """Returns a string representation of the server version."""
+    try:
+        return _server_versions[cursor]
+    except (KeyError, TypeError):
+        pass
+
     cursor.execute("SELECT VERSION() AS version")
     result = cursor.fetchone()
 
@@ -211,6 +233,12 @@ def get_server_version(cursor):
     else:
         version_str = result[0]
 
+    try:
+        _server_versions[cursor] = version_str
+    except TypeError:
+        # The cursor cannot be weakly referenced, do not cache
+        pass
+
     return version_str
 
 
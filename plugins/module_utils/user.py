@@ -11,10 +11,12 @@ __metaclass__ = type
 #
 # Simplified BSD License (see simplified_bsd.txt or https://opensource.org/licenses/BSD-2-Clause)
 
+import hmac
 import string
 import json
 import re
 
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils.six import iteritems
 
 from ansible_collections.community.mysql.plugins.module_utils.mysql import (
@@ -261,6 +263,22 @@ def is_hash(password):
     return ishash
 
 
+def password_hash_matches(current_hash, new_hash):
+    """Compare two password hashes in constant time.
+
+    Args:
+        current_hash (str): Hash stored on the server, None if there is none.
+        new_hash (str): Hash of the desired password.
+
+    Returns:
+        bool: True if the hashes are the same, False otherwise.
+    """
+    if current_hash is None or new_hash is None:
+        return current_hash is new_hash
+
+    return hmac.compare_digest(to_bytes(current_hash), to_bytes(new_hash))
+
+
 def user_mod(cursor, user, host, host_all, password, encrypted,
              plugin, plugin_hash_string, plugin_auth_string, salt, new_priv,
              append_privs, subtract_privs, attributes, tls_requires, module,
@@ -322,7 +340,7 @@ def user_mod(cursor, user, host, host_all, password, encrypted,
                         cursor.execute("SELECT CONCAT('*', UCASE(SHA1(UNHEX(SHA1(%s)))))", (password,))
                     encrypted_password = cursor.fetchone()[0]
 
-                if current_pass_hash != encrypted_password:
+                if not password_hash_matches(current_pass_hash, encrypted_password):
                     password_changed = True
                     msg = "Password updated"
                     if not module.check_mode:
@@ -423,6 +441,7 @@ def user_mod(cursor, user, host, host_all, password, encrypted,
         # Handle privileges
         if new_priv is not None:
             curr_priv = privileges_get(cursor, user, host, maria_role)
+            privs_applied = False
 
             # If the user has privileges on a db.table that doesn't appear at all in
             # the new specification, then revoke all privileges on it.
@@ -436,6 +455,7 @@ def user_mod(cursor, user, host, host_all, password, encrypted,
                             msg = "Privileges updated"
                             if not module.check_mode:
                                 privileges_revoke(cursor, user, host, db_table, priv, grant_option, maria_role)
+                                privs_applied = True
                             changed = True
 
             # If the user doesn't currently have any privileges on a db.table, then
@@ -446,6 +466,7 @@ def user_mod(cursor, user, host, host_all, password, encrypted,
                         msg = "New privileges granted"
                         if not module.check_mode:
                             privileges_grant(cursor, user, host, db_table, priv, tls_requires, maria_role)
+                            privs_applied = True
                         changed = True
 
             # If the db.table specification exists in both the user's current privileges
@@ -489,12 +510,15 @@ def user_mod(cursor, user, host, host_all, password, encrypted,
                             privileges_revoke(cursor, user, host, db_table, revoke_privs, grant_option, maria_role)
                         if len(grant_privs) > 0:
                             privileges_grant(cursor, user, host, db_table, grant_privs, tls_requires, maria_role)
+                        privs_applied = True
                     else:
                         changed = True
 
-            # after privilege manipulation, compare privileges from before and now
-            after_priv = privileges_get(cursor, user, host, maria_role)
-            changed = changed or (curr_priv != after_priv)
+            # after privilege manipulation, compare privileges from before and now.
+            # Nothing can differ if no GRANT or REVOKE was run.
+            if privs_applied:
+                after_priv = privileges_get(cursor, user, host, maria_role)
+                changed = changed or (curr_priv != after_priv)
 
         # Handle attributes
         attribute_support = get_attribute_support(cursor)
@@ -788,6 +812,9 @@ def privileges_unpack(priv, mode, column_case_sensitive, ensure_usage=True):
     output = {}
     privs = []
     for item in priv.strip().split('/'):
+        if ':' not in item:
+            raise InvalidPrivsError('"%s" is not in the format "db.table:privileges"' % item.strip())
+
         pieces = item.strip().rsplit(':', 1)
         dbpriv = pieces[0].rsplit(".", 1)
 
@@ -876,7 +903,7 @@ def privileges_grant(cursor, user, host, db_table, priv, tls_requires, maria_rol
         params = (user, host)
     else:
         query.append("TO %s")
-        params = (user)
+        params = (user,)
 
     impl = get_user_implementation(cursor)
     if tls_requires and impl.use_old_user_mgmt(cursor):
@@ -886,9 +913,6 @@ def privileges_grant(cursor, user, host, db_table, priv, tls_requires, maria_rol
         query.append("WITH GRANT OPTION")
     query = ' '.join(query)
 
-    if isinstance(params, str):
-        params = (params,)
-
     try:
         cursor.execute(query, params)
     except (mysql_driver.ProgrammingError, mysql_driver.OperationalError, mysql_driver.InternalError) as e:
@@ -303,6 +303,8 @@ RETURN = '''#'''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.community.mysql.plugins.module_utils.mysql import (
+    get_server_implementation,
+    is_server_unreachable,
     mysql_connect,
     mysql_driver,
     mysql_driver_fail_msg,
@@ -310,14 +312,12 @@ from ansible_collections.community.mysql.plugins.module_utils.mysql import (
 )
 from ansible_collections.community.mysql.plugins.module_utils.user import (
     convert_priv_dict_to_str,
-    get_user_implementation,
     get_mode,
     user_mod,
     privileges_grant,
     privileges_unpack,
 )
 from ansible.module_utils._text import to_native
-from ansible.module_utils.six import iteritems
 
 
 def normalize_users(module, users, is_mariadb=False):
@@ -326,6 +326,7 @@ def normalize_users(module, users, is_mariadb=False):
     Example of transformation:
     ['user0'] => [('user0', '')] / ['user0'] => [('user0', '%')]
     ['user0@host0'] => [('user0', 'host0')]
+    ['user0@example.com@host0'] => [('user0@example.com', 'host0')]
 
     Args:
         module (AnsibleModule): Object of the AnsibleModule class.
@@ -336,22 +337,20 @@ def normalize_users(module, users, is_mariadb=False):
         list: List of tuples like [('user0', ''), ('user0', 'host0')].
     """
     normalized_users = []
+    default_host = '' if is_mariadb else '%'
 
     for user in users:
         try:
-            tmp = user.split('@')
+            # Host names cannot contain '@', user names can
+            name, sep, host = user.rpartition('@')
 
-            if tmp[0] == '':
-                module.fail_json(msg="Member's name cannot be empty.")
+            if not sep:
+                name, host = host, default_host
 
-            if len(tmp) == 1:
-                if not is_mariadb:
-                    normalized_users.append((tmp[0], '%'))
-                else:
-                    normalized_users.append((tmp[0], ''))
+            if name == '':
+                module.fail_json(msg="Member's name cannot be empty.")
 
-            elif len(tmp) == 2:
-                normalized_users.append((tmp[0], tmp[1]))
+            normalized_users.append((name, host))
 
         except Exception as e:
             msg = ('Error occured while parsing the name "%s": %s. '
@@ -362,6 +361,32 @@ def normalize_users(module, users, is_mariadb=False):
     return normalized_users
 
 
+def get_grantee_list(users):
+    """Build the list of grantees for GRANT / REVOKE role statements.
+
+    Example of transformation:
+    [('user0', 'host0'), ('role0', '')] => ('%s@%s, %s', ('user0', 'host0', 'role0'))
+
+    Args:
+        users (list): List of tuples (username, hostname).
+
+    Returns:
+        tuple: (placeholders_string, tuple_containing_parameters).
+    """
+    placeholders = []
+    params = []
+
+    for user in users:
+        if user[1]:
+            placeholders.append('%s@%s')
+            params.extend(user)
+        else:
+            placeholders.append('%s')
+            params.append(user[0])
+
+    return ', '.join(placeholders), tuple(params)
+
+
 class DbServer():
     """Class to fetch information from a database.
 
@@ -376,7 +401,6 @@ class DbServer():
             on a server type (MariaDB or MySQL)
         mariadb (bool): True if MariaDB, False otherwise.
         roles_supported (bool): True if roles are supported, False otherwise.
-        users (set): Set of users existing in a DB in the form (username, hostname).
     """
     def __init__(self, module, cursor):
         self.module = module
@@ -384,7 +408,6 @@ class DbServer():
         self.role_impl = self.get_implementation()
         self.mariadb = self.role_impl.is_mariadb()
         self.roles_supported = self.role_impl.supports_roles(self.cursor)
-        self.users = set(self.__get_users())
 
     def is_mariadb(self):
         """Get info whether a DB server is a MariaDB instance.
@@ -408,9 +431,7 @@ class DbServer():
         Returns:
             library: Depending on a server type (MySQL or MariaDB).
         """
-        self.cursor.execute("SELECT VERSION()")
-
-        if 'mariadb' in self.cursor.fetchone()[0].lower():
+        if get_server_implementation(self.cursor) == 'mariadb':
             import ansible_collections.community.mysql.plugins.module_utils.implementations.mariadb.role as role_impl
         else:
             import ansible_collections.community.mysql.plugins.module_utils.implementations.mysql.role as role_impl
@@ -420,52 +441,49 @@ class DbServer():
     def check_users_in_db(self, users):
         """Check if users exist in a database.
 
+        Fails reporting all the users that do not exist.
+
         Args:
             users (list): List of tuples (username, hostname) to check.
         """
-        for user in users:
-            if user not in self.users:
-                msg = 'User / role `%s` with host `%s` does not exist' % (user[0], user[1])
-                self.module.fail_json(msg=msg)
+        existing = self.get_existing_users(users)
+        missing = [user for user in users if user not in existing]
+
+        if missing:
+            msg = '; '.join('User / role `%s` with host `%s` does not exist' % (user[0], user[1])
+                            for user in missing)
+            self.module.fail_json(msg=msg)
 
     def filter_existing_users(self, users):
+        existing = self.get_existing_users(users)
         for user in users:
-            if user in self.users:
+            if user in existing:
                 yield user
 
-    def __get_users(self):
-        """Get users.
+    def get_existing_users(self, users):
+        """Get which of the passed users exist in a DB.
 
-        Returns:
-            list: List of tuples (username, hostname).
-        """
-        self.cursor.execute('SELECT User, Host FROM mysql.user')
-        return self.cursor.fetchall()
+        Only the passed users are looked up, in a single query,
+        instead of reading the whole mysql.user table.
 
-    def get_users(self):
-        """Get set of tuples (username, hostname) existing in a DB.
+        Args:
+            users (list): List of tuples (username, hostname) to look up.
 
         Returns:
-            self.users: Attribute value.
+            set: Set of tuples (username, hostname).
         """
-        return self.users
+        if not users:
+            return set()
 
-    def get_grants(self, user, host):
-        """Get grants.
+        params = []
+        for user in users:
+            params.extend(user)
 
-        Args:
-            user (str): User name
-            host (str): Host name
+        query = ('SELECT User, Host FROM mysql.user WHERE (User, Host) IN (%s)'
+                 % ', '.join(['(%s, %s)'] * len(users)))
 
-        Returns:
-            list: List of tuples like [(grant1,), (grant2,), ... ].
-        """
-        if host:
-            self.cursor.execute('SHOW GRANTS FOR %s@%s', (user, host))
-        else:
-            self.cursor.execute('SHOW GRANTS FOR %s', (user,))
-
-        return self.cursor.fetchall()
+        self.cursor.execute(query, tuple(params))
+        return set(self.cursor.fetchall())
 
 
 class MySQLQueryBuilder():
@@ -489,35 +507,40 @@ class MySQLQueryBuilder():
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        return 'SELECT count(*) FROM mysql.user WHERE user = %s AND host = %s', (self.name, self.host)
+        return 'SELECT 1 FROM mysql.user WHERE user = %s AND host = %s LIMIT 1', (self.name, self.host)
 
-    def role_grant(self, user):
-        """Return a query to grant a role to a user or a role.
+    def role_members(self):
+        """Return a query to get members of a role with self.name and self.host.
+
+        Returns:
+            tuple: (query_string, tuple_containing_parameters).
+        """
+        return ('SELECT TO_USER, TO_HOST FROM mysql.role_edges '
+                'WHERE FROM_USER = %s AND FROM_HOST = %s'), (self.name, self.host)
+
+    def role_grant(self, users):
+        """Return a query to grant a role to users or roles.
 
         Args:
-            user (tuple): User / role to grant the role to in the form (username, hostname).
+            users (list): Users / roles to grant the role to in the form (username, hostname).
 
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        if user[1]:
-            return 'GRANT %s@%s TO %s@%s', (self.name, self.host, user[0], user[1])
-        else:
-            return 'GRANT %s@%s TO %s', (self.name, self.host, user[0])
+        grantees, params = get_grantee_list(users)
+        return 'GRANT %s@%s TO ' + grantees, (self.name, self.host) + params
 
-    def role_revoke(self, user):
-        """Return a query to revoke a role from a user or role.
+    def role_revoke(self, users):
+        """Return a query to revoke a role from users or roles.
 
         Args:
-            user (tuple): User / role to revoke the role from in the form (username, hostname).
+            users (list): Users / roles to revoke the role from in the form (username, hostname).
 
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        if user[1]:
-            return 'REVOKE %s@%s FROM %s@%s', (self.name, self.host, user[0], user[1])
-        else:
-            return 'REVOKE %s@%s FROM %s', (self.name, self.host, user[0])
+        grantees, params = get_grantee_list(users)
+        return 'REVOKE %s@%s FROM ' + grantees, (self.name, self.host) + params
 
     def role_create(self, admin=None):
         """Return a query to create a role.
@@ -550,35 +573,39 @@ class MariaDBQueryBuilder():
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        return "SELECT count(*) FROM mysql.user WHERE user = %s AND is_role  = 'Y'", (self.name,)
+        return "SELECT 1 FROM mysql.user WHERE user = %s AND is_role = 'Y' LIMIT 1", (self.name,)
 
-    def role_grant(self, user):
-        """Return a query to grant a role to a user or role.
+    def role_members(self):
+        """Return a query to get members of a role with self.name.
+
+        Returns:
+            tuple: (query_string, tuple_containing_parameters).
+        """
+        return 'SELECT User, Host FROM mysql.roles_mapping WHERE Role = %s', (self.name,)
+
+    def role_grant(self, users):
+        """Return a query to grant a role to users or roles.
 
         Args:
-            user (tuple): User / role to grant the role to in the form (username, hostname).
+            users (list): Users / roles to grant the role to in the form (username, hostname).
 
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        if user[1]:
-            return 'GRANT %s TO %s@%s', (self.name, user[0], user[1])
-        else:
-            return 'GRANT %s TO %s', (self.name, user[0])
+        grantees, params = get_grantee_list(users)
+        return 'GRANT %s TO ' + grantees, (self.name,) + params
 
-    def role_revoke(self, user):
-        """Return a query to revoke a role from a user or role.
+    def role_revoke(self, users):
+        """Return a query to revoke a role from users or roles.
 
         Args:
-            user (tuple): User / role to revoke the role from in the form (username, hostname).
+            users (list): Users / roles to revoke the role from in the form (username, hostname).
 
         Returns:
             tuple: (query_string, tuple_containing_parameters).
         """
-        if user[1]:
-            return 'REVOKE %s FROM %s@%s', (self.name, user[0], user[1])
-        else:
-            return 'REVOKE %s FROM %s', (self.name, user[0])
+        grantees, params = get_grantee_list(users)
+        return 'REVOKE %s FROM ' + grantees, (self.name,) + params
 
     def role_create(self, admin=None):
         """Return a query to create a role.
@@ -619,16 +646,14 @@ class MySQLRoleImpl():
         self.name = name
         self.host = host
 
-    def set_default_role_all(self, user):
-        """Run 'SET DEFAULT ROLE ALL TO' a user.
+    def set_default_role_all(self, users):
+        """Run 'SET DEFAULT ROLE ALL TO' users.
 
         Args:
-            user (tuple): User / role to run the command against in the form (username, hostname).
+            users (list): Users / roles to run the command against in the form (username, hostname).
         """
-        if user[1]:
-            self.cursor.execute('SET DEFAULT ROLE ALL TO %s@%s', (user[0], user[1]))
-        else:
-            self.cursor.execute('SET DEFAULT ROLE ALL TO %s', (user[0],))
+        grantees, params = get_grantee_list(users)
+        self.cursor.execute('SET DEFAULT ROLE ALL TO ' + grantees, params)
 
     def get_admin(self):
         """Get a current admin of a role.
@@ -668,13 +693,13 @@ class MariaDBRoleImpl():
         self.cursor = cursor
         self.name = name
 
-    def set_default_role_all(self, user):
-        """Run 'SET DEFAULT ROLE ALL TO' a user.
+    def set_default_role_all(self, users):
+        """Run 'SET DEFAULT ROLE ALL TO' users.
 
         The command is not supported by MariaDB, ignored.
 
         Args:
-            user (tuple): User / role to run the command against in the form (username, hostname).
+            users (list): Users / roles to run the command against in the form (username, hostname).
         """
         pass
 
@@ -749,10 +774,22 @@ class Role():
             self.full_name = '`%s`@`%s`' % (self.name, self.host)
 
         self.exists = self.__role_exists()
-        self.members = set()
+        self._members = None
+
+    @property
+    def members(self):
+        """Get current role's members.
 
-        if self.exists:
-            self.members = self.__get_members()
+        The members are fetched on first access only,
+        so dropping a role does not query them.
+
+        Returns:
+            set: Members.
+        """
+        if self._members is None:
+            self._members = self.__get_members() if self.exists else set()
+
+        return self._members
 
     def __role_exists(self):
         """Check if a role exists.
@@ -761,7 +798,7 @@ class Role():
             bool: True if the role exists, False if it does not.
         """
         self.cursor.execute(*self.q_builder.role_exists())
-        return self.cursor.fetchone()[0] > 0
+        return self.cursor.fetchone() is not None
 
     def add(self, users, privs, check_mode=False, admin=False,
             set_default_role_all=True):
@@ -788,7 +825,7 @@ class Role():
             self.update_members(users, set_default_role_all=set_default_role_all)
 
         if privs:
-            for db_table, priv in iteritems(privs):
+            for db_table, priv in privs.items():
                 privileges_grant(self.cursor, self.name, self.host,
                                  db_table, priv, tls_requires=None,
                                  maria_role=self.is_mariadb)
@@ -807,7 +844,7 @@ class Role():
         if not self.exists:
             return False
 
-        if check_mode and self.exists:
+        if check_mode:
             return True
 
         self.cursor.execute('DROP ROLE %s', (self.name,))
@@ -830,27 +867,28 @@ class Role():
         if not users:
             return False
 
-        changed = False
-        for user in users:
-            if user not in self.members:
-                if check_mode:
-                    return True
+        users = set(users)
+        to_grant = users - self.members
 
-                self.cursor.execute(*self.q_builder.role_grant(user))
+        if append_members:
+            to_revoke = set()
+        else:
+            to_revoke = self.members - users
+            to_revoke.discard(('root', 'localhost'))
 
-                if set_default_role_all:
-                    self.role_impl.set_default_role_all(user)
+        if check_mode:
+            return bool(to_grant or to_revoke)
 
-                changed = True
+        if to_grant:
+            self.cursor.execute(*self.q_builder.role_grant(to_grant))
 
-        if append_members:
-            return changed
+            if set_default_role_all:
+                self.role_impl.set_default_role_all(to_grant)
 
-        for user in self.members:
-            if user not in users and user != ('root', 'localhost'):
-                changed = self.__remove_member(user, check_mode)
+        if to_revoke:
+            self.cursor.execute(*self.q_builder.role_revoke(to_revoke))
 
-        return changed
+        return bool(to_grant or to_revoke)
 
     def remove_members(self, users, check_mode=False):
         """Remove members from a role.
@@ -865,29 +903,15 @@ class Role():
         if not users:
             return False
 
-        changed = False
-        for user in users:
-            if user in self.members:
-                changed = self.__remove_member(user, check_mode)
-
-        return changed
-
-    def __remove_member(self, user, check_mode=False):
-        """Remove a member from a role.
-
-        Args:
-            user (str): Role member to remove.
-            check_mode (bool): If True, just returns True and does nothing.
+        to_revoke = self.members.intersection(users)
 
-        Returns:
-            bool: True if the state has changed, False if has not.
-        """
         if check_mode:
-            return True
+            return bool(to_revoke)
 
-        self.cursor.execute(*self.q_builder.role_revoke(user))
+        if to_revoke:
+            self.cursor.execute(*self.q_builder.role_revoke(to_revoke))
 
-        return True
+        return bool(to_revoke)
 
     def update(self, users, privs, check_mode=False,
                append_privs=False, subtract_privs=False,
@@ -950,10 +974,7 @@ class Role():
         Returns:
             set: Members.
         """
-        if self.is_mariadb:
-            self.cursor.execute('select user, host from mysql.roles_mapping where role = %s', (self.name,))
-        else:
-            self.cursor.execute('select TO_USER as user, TO_HOST as host from mysql.role_edges where FROM_USER = %s', (self.name,))
+        self.cursor.execute(*self.q_builder.role_members())
         return set(self.cursor.fetchall())
 
 
@@ -1015,8 +1036,21 @@ def main():
         module.fail_json(msg=msg)
 
     if priv and isinstance(priv, dict):
+        for db_table, privs in priv.items():
+            if not isinstance(privs, str):
+                msg = ('The privileges of "%s" in the "priv" parameter must be str '
+                       'but %s was passed' % (db_table, type(privs)))
+                module.fail_json(msg=msg)
+
         priv = convert_priv_dict_to_str(priv)
 
+    # Catch malformed privileges before connecting to the server
+    if isinstance(priv, str):
+        for item in priv.strip().split('/'):
+            if ':' not in item:
+                module.fail_json(msg='Invalid privileges string: "%s" is not '
+                                     'in the format "db.table:privileges"' % item.strip())
+
     if mysql_driver is None:
         module.fail_json(msg=mysql_driver_fail_msg)
 
@@ -1036,8 +1070,11 @@ def main():
                                                 connect_timeout=connect_timeout,
                                                 check_hostname=check_hostname,
                                                 autocommit=True)
-            except Exception:
-                pass
+            except Exception as e:
+                # Do not wait for a second timeout connecting
+                # to the same unreachable server below
+                if is_server_unreachable(e):
+                    raise
 
         if not cursor:
             cursor, db_conn = mysql_connect(module, login_user, login_password,
@@ -1055,8 +1092,6 @@ def main():
     # Set defaults
     changed = False
 
-    impl = get_user_implementation(cursor)
-
     if priv is not None:
         try:
             mode = get_mode(cursor)
@@ -567,7 +567,10 @@ def main():
         except Exception as e:
             module.fail_json(msg=to_native(e))
 
-        priv = privileges_unpack(priv, mode, column_case_sensitive, ensure_usage=not subtract_privs)
+        try:
+            priv = privileges_unpack(priv, mode, column_case_sensitive, ensure_usage=not subtract_privs)
+        except InvalidPrivsError as e:
+            module.fail_json(msg='Invalid privileges string: %s' % to_native(e))
     password_changed = False
     final_attributes = None
     if state == "present":
@@ -4,7 +4,11 @@ __metaclass__ = type
 
 import pytest
 
-from ansible_collections.community.mysql.plugins.module_utils.mysql import get_server_version, get_server_implementation
+from ansible_collections.community.mysql.plugins.module_utils.mysql import (
+    get_server_version,
+    get_server_implementation,
+    is_server_unreachable,
+)
 from ..utils import dummy_cursor_class
 
 
@@ -41,3 +45,37 @@ def test_get_server_implamentation(cursor_return_version, cursor_return_type, se
     cursor = dummy_cursor_class(cursor_return_version, cursor_return_type)
 
     assert get_server_implementation(cursor) == server_implementation
+
+
+def test_get_server_version_queried_once():
+    """Test that get_server_version() reuses the version already read with the same cursor."""
+    class counting_cursor_class(dummy_cursor_class):
+        executed = 0
+
+        def execute(self, query):
+            self.executed += 1
+
+    cursor = counting_cursor_class('8.0.0-mysql', 'list')
+    assert get_server_version(cursor) == '8.0.0-mysql'
+    assert get_server_implementation(cursor) == 'mysql'
+    assert cursor.executed == 1
+
+    other_cursor = counting_cursor_class('10.5.1-mariadb', 'dict')
+    assert get_server_version(other_cursor) == '10.5.1-mariadb'
+    assert other_cursor.executed == 1
+
+
+@pytest.mark.parametrize(
+    'error,unreachable',
+    [
+        (Exception(2002, "Can't connect to local MySQL server through socket"), True),
+        (Exception(2003, "Can't connect to MySQL server on 'localhost'"), True),
+        (Exception(2005, "Unknown MySQL server host 'fake'"), True),
+        (Exception(1045, "Access denied for user 'root'@'localhost'"), False),
+        (Exception("Not a driver error"), False),
+        (Exception(), False),
+    ]
+)
+def test_is_server_unreachable(error, unreachable):
+    """Test that only errors raised before authentication are reported as unreachable."""
+    assert is_server_unreachable(error) == unreachable
@@ -6,9 +6,11 @@ __metaclass__ = type
 import pytest
 
 from ansible_collections.community.mysql.plugins.module_utils.user import (
+    InvalidPrivsError,
     handle_grant_on_col,
     has_grant_on_col,
     normalize_col_grants,
+    password_hash_matches,
     sort_column_order,
     privileges_unpack,
 )
@@ -111,3 +113,36 @@ def test_normalize_col_grants(input_, expected):
 def test_privileges_unpack(priv, mode, column_case_sensitive, ensure_usage, expected):
     """Tests privileges_unpack function."""
     assert privileges_unpack(priv, mode, column_case_sensitive, ensure_usage) == expected
+
+
+@pytest.mark.parametrize(
+    'priv,err_msg',
+    [
+        ('', '"" is not in the format'),
+        ('mydb.*', '"mydb.*" is not in the format'),
+        ('mydb.*:SELECT/otherdb.*', '"otherdb.*" is not in the format'),
+    ]
+)
+def test_privileges_unpack_missing_colon(priv, err_msg):
+    """Tests privileges_unpack function with entries lacking privileges."""
+    with pytest.raises(InvalidPrivsError) as excinfo:
+        privileges_unpack(priv, 'NOTANSI', False)
+
+    assert err_msg in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    'current_hash,new_hash,expected',
+    [
+        ('*6C387FC3893DBA1E3BA155E74754DA6682D04747', '*6C387FC3893DBA1E3BA155E74754DA6682D04747', True),
+        # Only covers the helper's to_bytes normalisation, user_mod decodes bytes hashes beforehand
+        (b'*6C387FC3893DBA1E3BA155E74754DA6682D04747', '*6C387FC3893DBA1E3BA155E74754DA6682D04747', True),
+        ('*6C387FC3893DBA1E3BA155E74754DA6682D04747', '*6C387FC3893DBA1E3BA155E74754DA6682D04748', False),
+        ('*6C387FC3893DBA1E3BA155E74754DA6682D04747', '*6C387FC3893DBA1E3BA155E74754DA6682D0474', False),
+        (None, '*6C387FC3893DBA1E3BA155E74754DA6682D04747', False),
+        (None, None, True),
+    ]
+)
+def test_password_hash_matches(current_hash, new_hash, expected):
+    """Test password_hash_matches function."""
+    assert password_hash_matches(current_hash, new_hash) == expected
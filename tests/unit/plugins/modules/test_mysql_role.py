@@ -6,8 +6,11 @@ __metaclass__ = type
 import pytest
 
 from ansible_collections.community.mysql.plugins.modules.mysql_role import (
+    DbServer,
     MariaDBQueryBuilder,
     MySQLQueryBuilder,
+    MySQLRoleImpl,
+    Role,
     normalize_users,
 )
 
@@ -25,13 +28,29 @@ class Module():
 module = Module()
 
 
+class Cursor():
+    def __init__(self, version='8.0.30', rows=None):
+        self.version = version
+        self.rows = rows or []
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchone(self):
+        return (self.version,)
+
+    def fetchall(self):
+        return self.rows
+
+
 @pytest.mark.parametrize(
     'builder,output',
     [
-        (MariaDBQueryBuilder('role0'), ("SELECT count(*) FROM mysql.user WHERE user = %s AND is_role  = 'Y'", ('role0',))),
-        (MySQLQueryBuilder('role0', '%'), ('SELECT count(*) FROM mysql.user WHERE user = %s AND host = %s', ('role0', '%'))),
-        (MariaDBQueryBuilder('role1'), ("SELECT count(*) FROM mysql.user WHERE user = %s AND is_role  = 'Y'", ('role1',))),
-        (MySQLQueryBuilder('role1', 'fake'), ('SELECT count(*) FROM mysql.user WHERE user = %s AND host = %s', ('role1', 'fake'))),
+        (MariaDBQueryBuilder('role0'), ("SELECT 1 FROM mysql.user WHERE user = %s AND is_role = 'Y' LIMIT 1", ('role0',))),
+        (MySQLQueryBuilder('role0', '%'), ('SELECT 1 FROM mysql.user WHERE user = %s AND host = %s LIMIT 1', ('role0', '%'))),
+        (MariaDBQueryBuilder('role1'), ("SELECT 1 FROM mysql.user WHERE user = %s AND is_role = 'Y' LIMIT 1", ('role1',))),
+        (MySQLQueryBuilder('role1', 'fake'), ('SELECT 1 FROM mysql.user WHERE user = %s AND host = %s LIMIT 1', ('role1', 'fake'))),
     ]
 )
 def test_query_builder_role_exists(builder, output):
@@ -39,6 +58,21 @@ def test_query_builder_role_exists(builder, output):
     assert builder.role_exists() == output
 
 
+@pytest.mark.parametrize(
+    'builder,output',
+    [
+        (MariaDBQueryBuilder('role0'), ('SELECT User, Host FROM mysql.roles_mapping WHERE Role = %s', ('role0',))),
+        (MySQLQueryBuilder('role0', '%'), ('SELECT TO_USER, TO_HOST FROM mysql.role_edges '
+                                           'WHERE FROM_USER = %s AND FROM_HOST = %s', ('role0', '%'))),
+        (MySQLQueryBuilder('role1', 'fake'), ('SELECT TO_USER, TO_HOST FROM mysql.role_edges '
+                                              'WHERE FROM_USER = %s AND FROM_HOST = %s', ('role1', 'fake'))),
+    ]
+)
+def test_query_builder_role_members(builder, output):
+    """Test role_members method of the builder classes."""
+    assert builder.role_members() == output
+
+
 @pytest.mark.parametrize(
     'builder,admin,output',
     [
@@ -58,31 +92,170 @@ def test_query_builder_role_create(builder, admin, output):
 
 
 @pytest.mark.parametrize(
-    'builder,user,output',
+    'builder,users,output',
     [
-        (MariaDBQueryBuilder('role0'), ('user0', ''), ('GRANT %s TO %s', ('role0', 'user0'))),
-        (MySQLQueryBuilder('role0', '%'), ('user0', ''), ('GRANT %s@%s TO %s', ('role0', '%', 'user0'))),
-        (MariaDBQueryBuilder('role1'), ('user0', 'localhost'), ('GRANT %s TO %s@%s', ('role1', 'user0', 'localhost'))),
-        (MySQLQueryBuilder('role1', 'fake'), ('user0', 'localhost'), ('GRANT %s@%s TO %s@%s', ('role1', 'fake', 'user0', 'localhost'))),
+        (MariaDBQueryBuilder('role0'), [('user0', '')], ('GRANT %s TO %s', ('role0', 'user0'))),
+        (MySQLQueryBuilder('role0', '%'), [('user0', '')], ('GRANT %s@%s TO %s', ('role0', '%', 'user0'))),
+        (MariaDBQueryBuilder('role1'), [('user0', 'localhost')], ('GRANT %s TO %s@%s', ('role1', 'user0', 'localhost'))),
+        (MySQLQueryBuilder('role1', 'fake'), [('user0', 'localhost')], ('GRANT %s@%s TO %s@%s', ('role1', 'fake', 'user0', 'localhost'))),
+        (MariaDBQueryBuilder('role0'), [('user0', 'localhost'), ('role1', '')],
+         ('GRANT %s TO %s@%s, %s', ('role0', 'user0', 'localhost', 'role1'))),
+        (MySQLQueryBuilder('role0', '%'), [('user0', 'localhost'), ('user1', '%')],
+         ('GRANT %s@%s TO %s@%s, %s@%s', ('role0', '%', 'user0', 'localhost', 'user1', '%'))),
     ]
 )
-def test_query_builder_role_grant(builder, user, output):
+def test_query_builder_role_grant(builder, users, output):
     """Test role_grant method of the builder classes."""
-    assert builder.role_grant(user) == output
+    assert builder.role_grant(users) == output
 
 
 @pytest.mark.parametrize(
-    'builder,user,output',
+    'builder,users,output',
     [
-        (MariaDBQueryBuilder('role0'), ('user0', ''), ('REVOKE %s FROM %s', ('role0', 'user0'))),
-        (MySQLQueryBuilder('role0', '%'), ('user0', ''), ('REVOKE %s@%s FROM %s', ('role0', '%', 'user0'))),
-        (MariaDBQueryBuilder('role1'), ('user0', 'localhost'), ('REVOKE %s FROM %s@%s', ('role1', 'user0', 'localhost'))),
-        (MySQLQueryBuilder('role1', 'fake'), ('user0', 'localhost'), ('REVOKE %s@%s FROM %s@%s', ('role1', 'fake', 'user0', 'localhost'))),
+        (MariaDBQueryBuilder('role0'), [('user0', '')], ('REVOKE %s FROM %s', ('role0', 'user0'))),
+        (MySQLQueryBuilder('role0', '%'), [('user0', '')], ('REVOKE %s@%s FROM %s', ('role0', '%', 'user0'))),
+        (MariaDBQueryBuilder('role1'), [('user0', 'localhost')], ('REVOKE %s FROM %s@%s', ('role1', 'user0', 'localhost'))),
+        (MySQLQueryBuilder('role1', 'fake'), [('user0', 'localhost')], ('REVOKE %s@%s FROM %s@%s', ('role1', 'fake', 'user0', 'localhost'))),
+        (MariaDBQueryBuilder('role0'), [('user0', 'localhost'), ('role1', '')],
+         ('REVOKE %s FROM %s@%s, %s', ('role0', 'user0', 'localhost', 'role1'))),
+        (MySQLQueryBuilder('role0', '%'), [('user0', 'localhost'), ('user1', '%')],
+         ('REVOKE %s@%s FROM %s@%s, %s@%s', ('role0', '%', 'user0', 'localhost', 'user1', '%'))),
     ]
 )
-def test_query_builder_role_revoke(builder, user, output):
+def test_query_builder_role_revoke(builder, users, output):
     """Test role_revoke method of the builder classes."""
-    assert builder.role_revoke(user) == output
+    assert builder.role_revoke(users) == output
+
+
+@pytest.mark.parametrize('builder', [MariaDBQueryBuilder('role0'), MySQLQueryBuilder('role0', '%')])
+@pytest.mark.parametrize(
+    'method,args',
+    [
+        ('role_exists', ()),
+        ('role_members', ()),
+        ('role_create', ()),
+        ('role_create', (('user0', 'localhost'),)),
+        ('role_grant', ([('user0', 'localhost')],)),
+        ('role_revoke', ([('user0', 'localhost')],)),
+    ]
+)
+def test_query_builder_returns_query_and_params(builder, method, args):
+    """Test that all builder methods return a query string and a tuple of parameters."""
+    query, params = getattr(builder, method)(*args)
+    assert isinstance(query, str)
+    assert isinstance(params, tuple)
+
+
+@pytest.mark.parametrize(
+    'users,output',
+    [
+        ([('user0', 'localhost')], ('SET DEFAULT ROLE ALL TO %s@%s', ('user0', 'localhost'))),
+        ([('user0', 'localhost'), ('role1', '')], ('SET DEFAULT ROLE ALL TO %s@%s, %s', ('user0', 'localhost', 'role1'))),
+    ]
+)
+def test_mysql_role_impl_set_default_role_all(users, output):
+    """Test that set_default_role_all runs one statement for all users."""
+    cursor = Cursor()
+    MySQLRoleImpl(module, cursor, 'role0', '%').set_default_role_all(users)
+    assert cursor.executed == [output]
+
+
+@pytest.mark.parametrize(
+    'version,users,output',
+    [
+        ('8.0.30', [('user0', 'localhost')],
+         ('SELECT User, Host FROM mysql.user WHERE (User, Host) IN ((%s, %s))', ('user0', 'localhost'))),
+        ('8.0.30', [('user0', 'localhost'), ('user1', '%')],
+         ('SELECT User, Host FROM mysql.user WHERE (User, Host) IN ((%s, %s), (%s, %s))',
+          ('user0', 'localhost', 'user1', '%'))),
+        ('10.5.8-MariaDB', [('user0', 'localhost'), ('role1', '')],
+         ('SELECT User, Host FROM mysql.user WHERE (User, Host) IN ((%s, %s), (%s, %s))',
+          ('user0', 'localhost', 'role1', ''))),
+    ]
+)
+def test_db_server_get_existing_users(version, users, output):
+    """Test that get_existing_users looks up only the passed users in one query."""
+    cursor = Cursor(version, rows=[users[0]])
+    server = DbServer(module, cursor)
+    cursor.executed = []
+
+    assert server.get_existing_users(users) == {users[0]}
+    assert cursor.executed == [output]
+
+
+def test_db_server_get_existing_users_empty():
+    """Test that get_existing_users does not query the server for no users."""
+    cursor = Cursor()
+    server = DbServer(module, cursor)
+    cursor.executed = []
+
+    assert server.get_existing_users([]) == set()
+    assert cursor.executed == []
+
+
+def get_role(members):
+    """Return a MySQL role0@% with preset members and a clean cursor."""
+    cursor = Cursor()
+    role = Role(module, cursor, 'role0', DbServer(module, cursor))
+    role._members = set(members)
+    cursor.executed = []
+    return role, cursor
+
+
+CURRENT_MEMBERS = [('user0', '%'), ('user1', '%'), ('root', 'localhost')]
+
+
+@pytest.mark.parametrize(
+    'users,kwargs,changed,executed',
+    [
+        # Grant only, members not passed are kept
+        ([('user2', '%')], {'append_members': True}, True,
+         [('GRANT %s@%s TO %s@%s', ('role0', '%', 'user2', '%')),
+          ('SET DEFAULT ROLE ALL TO %s@%s', ('user2', '%'))]),
+        ([('user2', '%')], {'append_members': True, 'set_default_role_all': False}, True,
+         [('GRANT %s@%s TO %s@%s', ('role0', '%', 'user2', '%'))]),
+        # Revoke only, root@localhost is never revoked
+        ([('user0', '%')], {}, True,
+         [('REVOKE %s@%s FROM %s@%s', ('role0', '%', 'user1', '%'))]),
+        # Grant and revoke
+        ([('user0', '%'), ('user2', '%')], {}, True,
+         [('GRANT %s@%s TO %s@%s', ('role0', '%', 'user2', '%')),
+          ('SET DEFAULT ROLE ALL TO %s@%s', ('user2', '%')),
+          ('REVOKE %s@%s FROM %s@%s', ('role0', '%', 'user1', '%'))]),
+        # Nothing to change
+        ([('user0', '%'), ('user1', '%')], {}, False, []),
+        ([('user0', '%')], {'append_members': True}, False, []),
+        ([], {}, False, []),
+        # Check mode reports the change without running anything
+        ([('user2', '%')], {'check_mode': True}, True, []),
+        ([('user0', '%'), ('user1', '%')], {'check_mode': True}, False, []),
+    ]
+)
+def test_role_update_members(users, kwargs, changed, executed):
+    """Test that update_members grants and revokes only the differences."""
+    role, cursor = get_role(CURRENT_MEMBERS)
+
+    assert role.update_members(users, **kwargs) is changed
+    assert cursor.executed == executed
+
+
+@pytest.mark.parametrize(
+    'users,kwargs,changed,executed',
+    [
+        ([('user1', '%'), ('user9', '%')], {}, True,
+         [('REVOKE %s@%s FROM %s@%s', ('role0', '%', 'user1', '%'))]),
+        ([('user9', '%')], {}, False, []),
+        ([], {}, False, []),
+        ([('user1', '%')], {'check_mode': True}, True, []),
+        ([('user9', '%')], {'check_mode': True}, False, []),
+    ]
+)
+def test_role_remove_members(users, kwargs, changed, executed):
+    """Test that remove_members revokes only current members."""
+    role, cursor = get_role(CURRENT_MEMBERS)
+
+    assert role.remove_members(users, **kwargs) is changed
+    assert cursor.executed == executed
 
 
 @pytest.mark.parametrize(
@@ -96,6 +269,8 @@ def test_query_builder_role_revoke(builder, user, output):
         (['user@localhost'], [('user', 'localhost')], False),
         (['user', 'user@%'], [('user', ''), ('user', '%')], True),
         (['user', 'user@%'], [('user', '%'), ('user', '%')], False),
+        (['user@example.com@localhost'], [('user@example.com', 'localhost')], True),
+        (['user@example.com@localhost'], [('user@example.com', 'localhost')], False),
     ]
 )
 def test_normalize_users(input_, output, is_mariadb):
@@ -108,6 +283,8 @@ def test_normalize_users(input_, output, is_mariadb):
     [
         ([''], True, "Member's name cannot be empty."),
         ([''], False, "Member's name cannot be empty."),
+        (['@localhost'], True, "Member's name cannot be empty."),
+        (['@localhost'], False, "Member's name cannot be empty."),
         ([None], True, "Error occured while parsing"),
         ([None], False, "Error occured while parsing"),
     ]